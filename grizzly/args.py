@@ -4,17 +4,76 @@
 from argparse import ArgumentParser, HelpFormatter
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 from os import getenv
-from os.path import exists
+from os import stat as os_stat
 from pathlib import Path
 from platform import system
+from stat import S_ISDIR, S_ISREG
 
 from .common.plugins import scan as scan_plugins
 from .common.plugins import scan_target_assets
 from .common.utils import DEFAULT_TIME_LIMIT, TIMEOUT_DELAY, __version__
 
+# log levels for console logging
+_LEVEL_MAP = {
+    "CRIT": CRITICAL,
+    "ERROR": ERROR,
+    "WARN": WARNING,
+    "INFO": INFO,
+    "DEBUG": DEBUG,
+}
+_LEVEL_CHOICES = tuple(sorted(_LEVEL_MAP))
+
+# bytes per MB, used to convert size arguments
+_MB = 1 << 20
+
+# help strings that depend on other values, formatted once at import
+_HELP_TIME_LIMIT = (
+    "Maximum expected execution time of a test case."
+    " If time-limit is reached before the test case has closed"
+    " the harness will attempt to close the test. If this fails for any reason"
+    " '--timeout' is the fallback."
+    " Browser build types and debuggers can affect the amount of time"
+    " required for test case execution to complete."
+    " (default: fuzzing - set by 'Adapter.TIME_LIMIT'; reduce/replay - "
+    f"duration from loaded test case or minimum {DEFAULT_TIME_LIMIT}s)"
+)
+_HELP_TIMEOUT = (
+    "Test case execution (iteration) timeout."
+    " If timeout is reached before the test case has closed"
+    " the target will be closed."
+    " Typically this should be '--time-limit' + a few seconds."
+    f" (default: '--test-limit' + {TIMEOUT_DELAY}s)"
+)
+_EPILOG = (
+    "For addition help check out the wiki:"
+    " https://github.com/MozillaSecurity/grizzly/wiki"
+)
+_VERSION = __version__ if __version__ else "Unknown - Package not installed."
+
+
+def _classify(path):
+    """Classify a filesystem entry using a single stat() call.
+
+    Args:
+        path (str): Path to check.
+
+    Returns:
+        tuple(bool, bool, bool): Entry exists, is a directory, is a regular file.
+    """
+    try:
+        mode = os_stat(path).st_mode
+    except (OSError, ValueError):
+        return False, False, False
+    return True, S_ISDIR(mode), S_ISREG(mode)
+
 
 # ref: https://stackoverflow.com/questions/12268602/sort-argparse-help-alphabetically
 class SortingHelpFormatter(HelpFormatter):
+    def __init__(self, *args, **kwds):
+        super().__init__(*args, **kwds)
+        # position of each action after sorting for usage
+        self._positions = {}
+
     @staticmethod
     def __sort_key(action):
         for opt in action.option_strings:
@@ -24,29 +83,50 @@ class SortingHelpFormatter(HelpFormatter):
 
     def add_usage(self, usage, actions, groups, prefix=None):
         actions = sorted(actions, key=self.__sort_key)
+        self._positions.update((action, idx) for idx, action in enumerate(actions))
         super().add_usage(usage, actions, groups, prefix)
 
     def add_arguments(self, actions):
-        actions = sorted(actions, key=self.__sort_key)
+        # argument groups are subsets of the usage actions, reuse the sorted order
+        if all(action in self._positions for action in actions):
+            actions = sorted(actions, key=self._positions.__getitem__)
+        else:
+            actions = sorted(actions, key=self.__sort_key)
         super().add_arguments(actions)
 
 
+class _LazyHelp:
+    """Help text that is only generated when it is rendered. This is used
+    to avoid expensive work (such as loading plug-ins) when building the parser.
+    """
+
+    __slots__ = ("_builder",)
+
+    def __init__(self, builder):
+        self._builder = builder
+
+    def __str__(self):
+        return self._builder()
+
+
 class CommonArgs:
-    IGNORABLE = ("log-limit", "memory", "timeout")
+    IGNORABLE = frozenset(("log-limit", "memory", "timeout"))
     DEFAULT_IGNORE = ("log-limit", "timeout")
+    # values are validated by sanity_check(), list them the way 'choices' would
+    _IGNORE_METAVAR = f"{{{','.join(sorted(IGNORABLE))}}}"
 
     def __init__(self):
-        # log levels for console logging
-        self._level_map = {
-            "CRIT": CRITICAL,
-            "ERROR": ERROR,
-            "WARN": WARNING,
-            "INFO": INFO,
-            "DEBUG": DEBUG,
-        }
+        # supported assets per target, see _target_assets()
+        self._assets = None
+        # errors found by sanity_check(), reported together by parse_args()
+        self._errors = []
+        # platform specific arguments
+        is_linux = system().startswith("Linux")
 
         self.parser = ArgumentParser(
-            formatter_class=SortingHelpFormatter, conflict_handler="resolve"
+            conflict_handler="resolve",
+            epilog=_EPILOG,
+            formatter_class=SortingHelpFormatter,
         )
 
         targets = scan_plugins("grizzly_targets")
@@ -56,27 +136,24 @@ class CommonArgs:
         self.parser.add_argument("binary", type=Path, help="Firefox binary to run")
         self.parser.add_argument(
             "--log-level",
-            choices=sorted(self._level_map),
+            choices=_LEVEL_CHOICES,
             default="INFO",
             help="Configure console logging (default: %(default)s)",
         )
 
-        # build 'asset' help string
-        assets = scan_target_assets()
-        asset_msg = []
-        for target in sorted(assets):
-            if assets[target]:
-                asset_msg.append(f"{target}: {', '.join(sorted(assets[target]))}.")
-
         self.launcher_grp = self.parser.add_argument_group("Launcher Arguments")
-        self.launcher_grp.add_argument(
+        asset_action = self.launcher_grp.add_argument(
             "--asset",
             action="append",
             default=[],
             metavar=("ASSET", "PATH"),
             nargs=2,
-            help=f"Specify target specific asset files. {''.join(asset_msg)}",
+            help="Specify target specific asset files. %(supported)s",
         )
+        # scanning assets loads all targets, only do it if help is displayed
+        # NOTE: argparse expands '%(supported)s' using vars(action), this relies
+        # on undocumented behavior
+        asset_action.supported = _LazyHelp(self._asset_help)
         self.launcher_grp.add_argument(
             "-e",
             "--extension",
@@ -89,7 +166,7 @@ class CommonArgs:
             help="Output launch failure logs to console. (default: %(default)s)",
         )
         headless_choices = ["default"]
-        if system().startswith("Linux"):
+        if is_linux:
             headless_choices.append("xvfb")
         self.launcher_grp.add_argument(
             "--headless",
@@ -160,34 +237,23 @@ class CommonArgs:
             "--time-limit",
             type=int,
             default=None,
-            help="Maximum expected execution time of a test case."
-            " If time-limit is reached before the test case has closed"
-            " the harness will attempt to close the test. If this fails for any reason"
-            " '--timeout' is the fallback."
-            " Browser build types and debuggers can affect the amount of time"
-            " required for test case execution to complete."
-            " (default: fuzzing - set by 'Adapter.TIME_LIMIT'; reduce/replay - "
-            f"duration from loaded test case or minimum {DEFAULT_TIME_LIMIT}s)",
+            help=_HELP_TIME_LIMIT,
         )
         self.launcher_grp.add_argument(
             "-t",
             "--timeout",
             type=int,
             default=None,
-            help="Test case execution (iteration) timeout."
-            " If timeout is reached before the test case has closed"
-            " the target will be closed."
-            " Typically this should be '--time-limit' + a few seconds."
-            f" (default: '--test-limit' + {TIMEOUT_DELAY}s)",
+            help=_HELP_TIMEOUT,
         )
         self.launcher_grp.add_argument(
             "--version",
             "-V",
             action="version",
-            version=__version__ if __version__ else "Unknown - Package not installed.",
+            version=_VERSION,
             help="Show version number",
         )
-        if system().startswith("Linux"):
+        if is_linux:
             self.launcher_grp.add_argument(
                 "--xvfb", action="store_true", help="DEPRECATED. Use Xvfb."
             )
@@ -201,8 +267,8 @@ class CommonArgs:
         self.reporter_grp.add_argument(
             "--ignore",
             nargs="*",
-            choices=self.IGNORABLE,
             default=self.DEFAULT_IGNORE,
+            metavar=self._IGNORE_METAVAR,
             help="Result types to ignore. Pass zero args to disable. NOTE: 'memory'"
             " only applies to OOMs detected by Grizzly. (default: %(default)s)",
         )
@@ -218,7 +284,7 @@ class CommonArgs:
             help="Override tool name used when reporting issues to FuzzManager",
         )
 
-        if system().startswith("Linux"):
+        if is_linux:
             dbg_group = self.launcher_grp.add_mutually_exclusive_group()
             dbg_group.add_argument(
                 "--pernosco",
@@ -236,10 +302,38 @@ class CommonArgs:
                 valgrind=False,
             )
 
-        self.parser.epilog = (
-            "For addition help check out the wiki:"
-            " https://github.com/MozillaSecurity/grizzly/wiki"
-        )
+    def _asset_help(self):
+        """Build list of supported assets for each installed target.
+
+        Args:
+            None
+
+        Returns:
+            str: Supported assets grouped by target.
+        """
+        assets = self._target_assets()
+        asset_msg = []
+        for target in sorted(assets):
+            if assets[target]:
+                asset_msg.append(f"{target}: {', '.join(sorted(assets[target]))}.")
+        return "".join(asset_msg)
+
+    def _target_assets(self):
+        """Scan installed targets for supported assets. Scanning loads each target
+        so the result is cached.
+
+        Args:
+            None
+
+        Returns:
+            dict: Name of target and frozenset of supported assets.
+        """
+        if self._assets is None:
+            self._assets = {
+                target: frozenset(assets or ())
+                for target, assets in scan_target_assets().items()
+            }
+        return self._assets
 
     @staticmethod
     def is_headless():
@@ -251,47 +345,69 @@ class CommonArgs:
             return True
         return False
 
+    def _mb_to_bytes(self, value, flag):
+        """Validate a size argument and convert it from MBs to bytes.
+
+        Args:
+            value (int): Size in MBs.
+            flag (str): Argument name used in the error message.
+
+        Returns:
+            int: Size in bytes.
+        """
+        if value < 0:
+            self._errors.append(f"{flag} must be >= 0")
+        return value * _MB
+
     def parse_args(self, argv=None):
         args = self.parser.parse_args(argv)
+        self._errors.clear()
         self.sanity_check(args)
+        if self._errors:
+            # report all errors at once
+            self.parser.error("\n  ".join(self._errors))
         return args
 
     def sanity_check(self, args):
         if not args.binary.is_file():
-            self.parser.error(f"file not found: '{args.binary!s}'")
+            self._errors.append(f"file not found: '{args.binary!s}'")
+
+        # remove duplicates (keep order for logging)
+        args.ignore = list(dict.fromkeys(args.ignore))
+        invalid = set(args.ignore) - self.IGNORABLE
+        if invalid:
+            self._errors.append(
+                f"Unrecognized ignore values: {', '.join(sorted(invalid))}"
+            )
 
         if args.launch_attempts < 1:
-            self.parser.error("--launch-attempts must be >= 1")
+            self._errors.append("--launch-attempts must be >= 1")
 
-        args.log_level = self._level_map[args.log_level]
+        args.log_level = _LEVEL_MAP[args.log_level]
 
-        if args.log_limit < 0:
-            self.parser.error("--log-limit must be >= 0")
-        args.log_limit *= 1_048_576
+        args.log_limit = self._mb_to_bytes(args.log_limit, "--log-limit")
 
         # if logs is specified, we need it to be a directory (whether existent or not)
         if args.logs and args.logs.is_file():
-            self.parser.error("--logs cannot be a file")
+            self._errors.append("--logs cannot be a file")
 
-        if args.memory < 0:
-            self.parser.error("--memory must be >= 0")
-        args.memory *= 1_048_576
+        args.memory = self._mb_to_bytes(args.memory, "--memory")
 
         if args.no_harness:
             if args.time_limit is not None:
-                self.parser.error("--time-limit cannot be used with --no-harness")
+                self._errors.append("--time-limit cannot be used with --no-harness")
             # --no-harness implies --relaunch 1
             args.relaunch = 1
 
         if args.relaunch < 1:
-            self.parser.error("--relaunch must be >= 1")
+            self._errors.append("--relaunch must be >= 1")
 
         if args.pernosco or args.rr:
             # currently we only support rr on Linux
             settings = "/proc/sys/kernel/perf_event_paranoid"
             value = int(Path(settings).read_text())
             if value > 1:
-                self.parser.error(f"rr needs {settings} <= 1, but it is {value}")
+                self._errors.append(f"rr needs {settings} <= 1, but it is {value}")
 
         # TODO: remove deprecated 'extension' from args
         if args.extension:  # pragma: no cover
@@ -303,31 +419,38 @@ class CommonArgs:
 
         # check args.platform before args.asset since it is used
         if args.asset:
-            supported_assets = scan_target_assets()[args.platform]
-            for asset, path in args.asset:
-                if not supported_assets or asset not in supported_assets:
-                    self.parser.error(
+            supported_assets = self._target_assets()[args.platform]
+            # skip duplicate entries to avoid checking the same path repeatedly
+            for asset, path in dict.fromkeys(tuple(x) for x in args.asset):
+                if asset not in supported_assets:
+                    self._errors.append(
                         f"Asset {asset!r} not supported by target {args.platform!r}"
                     )
-                if not exists(path):
-                    self.parser.error(
+                found, is_dir, is_file = _classify(path)
+                if not found:
+                    self._errors.append(
                         f"Failed to add asset {asset!r} cannot find {path!r}"
                     )
+                elif asset == "extension" and not (
+                    is_dir or (is_file and path.endswith(".xpi"))
+                ):
+                    self._errors.append(f"Extension {path!r} must be a folder or .xpi")
 
         if args.time_limit is not None and args.time_limit < 1:
-            self.parser.error("--time-limit must be >= 1")
+            self._errors.append("--time-limit must be >= 1")
 
         if args.timeout is not None and args.timeout < 0:
-            self.parser.error("--timeout must be >= 0")
+            self._errors.append("--timeout must be >= 0")
 
         if args.time_limit and args.timeout and args.timeout < args.time_limit:
-            self.parser.error("--timeout must be >= --time-limit")
+            self._errors.append("--timeout must be >= --time-limit")
 
         if args.tool:
             if not args.fuzzmanager:
-                self.parser.error("--tool requires --fuzzmanager")
-            if len(args.tool.split()) != 1 or args.tool.strip() != args.tool:
-                self.parser.error("--tool cannot contain whitespace")
+                self._errors.append("--tool requires --fuzzmanager")
+            # a single token equal to the input cannot contain any whitespace
+            if args.tool.split() != [args.tool]:
+                self._errors.append("--tool cannot contain whitespace")
 
         if args.xvfb:  # pragma: no cover
             args.headless = "xvfb"
@@ -412,19 +535,19 @@ class GrizzlyArgs(CommonArgs):
         super().sanity_check(args)
 
         if args.collect < 1:
-            self.parser.error("--collect must be greater than 0")
+            self._errors.append("--collect must be greater than 0")
 
         if args.input and not args.input.exists():
-            self.parser.error(f"'{args.input}' does not exist")
+            self._errors.append(f"'{args.input}' does not exist")
 
         if args.limit < 0:
-            self.parser.error("--limit must be >= 0")
+            self._errors.append("--limit must be >= 0")
 
         if args.limit_reports < 0:
-            self.parser.error("--limit-reports must be >= 0")
+            self._errors.append("--limit-reports must be >= 0")
 
         if args.runtime < 0:
-            self.parser.error("--runtime must be >= 0")
+            self._errors.append("--runtime must be >= 0")
 
         if args.smoke_test:
             if args.limit == 0:
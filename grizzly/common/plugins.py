@@ -49,11 +49,13 @@ def scan(group):
         list: Names of installed entry points.
     """
     found = []
+    seen = set()
     LOG.debug("scanning %r", group)
     for entry in iter_entry_points(group):
-        if entry.name in found:
+        if entry.name in seen:
             # not sure if this can even happen
             raise PluginLoadError(f"Duplicate entry {entry.name!r} in {group!r}")
+        seen.add(entry.name)
         found.append(entry.name)
     return found
 
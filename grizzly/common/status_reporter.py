@@ -17,7 +17,7 @@ except ImportError:  # pragma: no cover
     getloadavg = None
 from os import SEEK_CUR, getenv
 from pathlib import Path
-from re import match
+from re import compile as re_compile
 from re import sub as re_sub
 from time import gmtime, localtime, strftime
 
@@ -414,6 +414,10 @@ class TracebackReport:
 
     MAX_LINES = 16  # should be no less than 6
     READ_LIMIT = 0x20000  # 128KB
+    TOKEN = b"Traceback (most recent call last):"
+
+    # end of traceback (exception type and message)
+    _re_tb_end = re_compile(r"^\w+(\.\w+)*\:\s|^\w+(Interrupt|Error)$")
 
     def __init__(self, log_file, lines, is_kbi=False, prev_lines=None):
         assert isinstance(lines, list)
@@ -437,7 +441,7 @@ class TracebackReport:
         Returns:
             TracebackReport: Contains data from log_file.
         """
-        token = b"Traceback (most recent call last):"
+        token = cls.TOKEN
         assert len(token) < cls.READ_LIMIT
         try:
             with log_file.open("rb") as in_fp:
@@ -476,7 +480,7 @@ class TracebackReport:
                     # stop at first empty line
                     tb_end = min(line_num, line_count)
                     break
-                if match(r"^\w+(\.\w+)*\:\s|^\w+(Interrupt|Error)$", log_line):
+                if cls._re_tb_end.match(log_line):
                     is_kbi = log_line.startswith("KeyboardInterrupt")
                     if is_kbi and ignore_kbi:
                         # ignore this exception since it is a KeyboardInterrupt
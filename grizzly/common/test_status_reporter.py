@@ -5,7 +5,7 @@
 # pylint: disable=protected-access
 
 from itertools import count
-from re import match
+from re import compile as re_compile
 from unittest.mock import Mock
 
 from pytest import mark, raises
@@ -20,6 +20,15 @@ from .status_reporter import (
 )
 
 GBYTES = 1_073_741_824
+TB_FILE_LINE = b'  File "some/long/path/name/foobar.py", line 5000, in <module>\n'
+# used to verify summary entries are aligned on the separator
+ALIGN_RE = re_compile(r"\S\s:\s\S")
+# entries returned by the patched StatusReporter._sys_info()
+FAKE_SYS_INFO = (
+    ("CPU & Load", "64 @ 93% (85.25, 76.21, 51.06)"),
+    ("Memory", "183.9GB of 251.9GB free"),
+    ("Disk", "22.2GB of 28.7GB free"),
+)
 
 
 pytestmark = mark.usefixtures(
@@ -29,11 +38,7 @@ pytestmark = mark.usefixtures(
 
 
 def _fake_sys_info():
-    return [
-        ("CPU & Load", "64 @ 93% (85.25, 76.21, 51.06)"),
-        ("Memory", "183.9GB of 251.9GB free"),
-        ("Disk", "22.2GB of 28.7GB free"),
-    ]
+    return FAKE_SYS_INFO
 
 
 def test_reduce_status_reporter_01():
@@ -170,24 +175,29 @@ def test_reduce_status_reporter_05(tmp_path):
     # create boring screenlog
     (tmp_path / "screenlog.0").write_bytes(b"boring\ntest\n123\n")
     # create first screenlog
-    with (tmp_path / "screenlog.1").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"IndexError: list index out of range\n")
+    (tmp_path / "screenlog.1").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        b"IndexError: list index out of range\n"
+    )
     rptr = StatusReporter.load(db_file, tb_path=tmp_path)
     assert len(rptr.tracebacks) == 1
     # create second screenlog
-    with (tmp_path / "screenlog.1234").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"foo.bar.error: blah\n")
+    (tmp_path / "screenlog.1234").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        # exception type including module path
+        b"foo.bar.error: blah\n"
+    )
     rptr = StatusReporter.load(db_file, tb_path=tmp_path)
     assert len(rptr.tracebacks) == 2
     # create third screenlog
-    with (tmp_path / "screenlog.3").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"KeyboardInterrupt\n")
+    (tmp_path / "screenlog.3").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        # KeyboardInterrupt tracebacks are not included in the summary
+        b"KeyboardInterrupt\n"
+    )
     rptr = ReductionStatusReporter.load(db_file, tb_path=tmp_path)
     assert len(rptr.tracebacks) == 2
     merged_log = rptr.summary()
@@ -275,18 +285,17 @@ def test_status_reporter_03(mocker, disk, memory, getloadavg):
         assert "MB" not in sysinfo[2][-1]
 
 
-def test_status_reporter_04(mocker, tmp_path):
+def test_status_reporter_04(mocker, status_db_file):
     """test StatusReporter.summary()"""
     mocker.patch("grizzly.common.status.getpid", side_effect=(1, 2))
     mocker.patch("grizzly.common.status.time", side_effect=count(start=1.0, step=1.0))
-    db_file = tmp_path / "status.db"
     # single report
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 0
     status.iteration = 1
     status.log_size = 0
     status.report(force=True)
-    rptr = StatusReporter.load(db_file)
+    rptr = StatusReporter.load(status_db_file)
     rptr._sys_info = _fake_sys_info
     assert rptr.reports is not None
     assert len(rptr.reports) == 1
@@ -299,16 +308,16 @@ def test_status_reporter_04(mocker, tmp_path):
     assert "Logs" not in output
     assert "Runtime" not in output
     assert "Timestamp" not in output
-    assert len(output.split("\n")) == 3
+    assert output.count("\n") == 2
     # multiple reports
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 1
     status.iteration = 8
     status.log_size = 86900000
     status.results.count("test", "test")
     status.results.count("test", "test")
     status.report(force=True)
-    rptr = StatusReporter.load(db_file)
+    rptr = StatusReporter.load(status_db_file)
     rptr._sys_info = _fake_sys_info
     assert len(rptr.reports) == 2
     output = rptr.summary(rate=False, sysinfo=True, timestamp=True)
@@ -324,30 +333,29 @@ def test_status_reporter_04(mocker, tmp_path):
     # verify alignment
     position = len(lines[0].split(":")[0])
     for line in lines:
-        assert match(r"\S\s:\s\S", line[position - 2 :])
+        assert ALIGN_RE.match(line, position - 2)
 
 
-def test_status_reporter_05(mocker, tmp_path):
+def test_status_reporter_05(mocker, status_db_file):
     """test StatusReporter.specific()"""
     mocker.patch("grizzly.common.status.getpid", side_effect=(1, 2))
-    db_file = tmp_path / "status.db"
     # single report
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 0
     status.iteration = 1
     status.log_size = 0
     status.report(force=True)
-    rptr = StatusReporter.load(db_file)
+    rptr = StatusReporter.load(status_db_file)
     assert rptr.reports is not None
     output = rptr.specific()
-    assert len(output.strip().split("\n")) == 4
+    assert output.strip().count("\n") == 3
     assert "Ignored" not in output
     assert "Iterations" in output
     assert "Results" in output
     assert "(Blockers detected)" not in output
     assert "Runtime" in output
     # multiple reports
-    status = Status.start(db_file, enable_profiling=True)
+    status = Status.start(status_db_file, enable_profiling=True)
     status.ignored = 1
     status.iteration = 50
     status.results.count("uid1", "sig1")
@@ -358,10 +366,10 @@ def test_status_reporter_05(mocker, tmp_path):
     status.record("test1", 1.23456)
     status.record("test2", 1201.1)
     status.report(force=True)
-    rptr = StatusReporter.load(db_file)
+    rptr = StatusReporter.load(status_db_file)
     assert len(rptr.reports) == 2
     output = rptr.specific()
-    assert len(output.strip().split("\n")) == 13
+    assert output.strip().count("\n") == 12
     assert "Ignored" in output
     assert "Iterations" in output
     assert "Results" in output
@@ -372,34 +380,33 @@ def test_status_reporter_05(mocker, tmp_path):
     assert "test2" in output
 
 
-def test_status_reporter_06(mocker, tmp_path):
+def test_status_reporter_06(mocker, status_db_file):
     """test StatusReporter.results()"""
     mocker.patch("grizzly.common.status.getpid", side_effect=(1, 2, 3))
-    db_file = tmp_path / "status.db"
     # single report without results
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 0
     status.iteration = 1
     status.log_size = 0
     status.report(force=True)
-    rptr = StatusReporter.load(db_file)
+    rptr = StatusReporter.load(status_db_file)
     assert rptr.reports is not None
     assert len(rptr.reports) == 1
     assert not rptr.has_results
     assert rptr.results() == "No results available\n"
     # multiple reports with results
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.iteration = 1
     status.results.count("uid1", "[@ test1]")
     status.results.count("uid2", "[@ test2]")
     status.results.count("uid1", "[@ test1]")
     status.report(force=True)
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.iteration = 1
     status.results.count("uid1", "[@ test1]")
     status.results.count("uid3", "[@ longsignature123]")
     status.report(force=True)
-    rptr = StatusReporter.load(db_file)
+    rptr = StatusReporter.load(status_db_file)
     assert rptr.has_results
     assert len(rptr.reports) == 3
     output = rptr.results(max_len=19)
@@ -407,13 +414,12 @@ def test_status_reporter_06(mocker, tmp_path):
     assert "1 : [@ test2]" in output
     assert "1 : [@ longsignature..." in output
     assert "(* = Blocker)" in output
-    assert len(output.strip().split("\n")) == 4
+    assert output.strip().count("\n") == 3
 
 
-def test_status_reporter_07(tmp_path):
+def test_status_reporter_07(tmp_path, status_db_file):
     """test StatusReporter.load() with traceback"""
-    db_file = tmp_path / "status.db"
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 0
     status.iteration = 1
     status.log_size = 0
@@ -421,25 +427,30 @@ def test_status_reporter_07(tmp_path):
     # create boring screenlog
     (tmp_path / "screenlog.0").write_bytes(b"boring\ntest\n123\n")
     # create first screenlog
-    with (tmp_path / "screenlog.1").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"IndexError: list index out of range\n")
-    rptr = StatusReporter.load(db_file, tb_path=tmp_path)
+    (tmp_path / "screenlog.1").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        b"IndexError: list index out of range\n"
+    )
+    rptr = StatusReporter.load(status_db_file, tb_path=tmp_path)
     assert len(rptr.tracebacks) == 1
     # create second screenlog
-    with (tmp_path / "screenlog.1234").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"foo.bar.error: blah\n")
-    rptr = StatusReporter.load(db_file, tb_path=tmp_path)
+    (tmp_path / "screenlog.1234").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        # exception type including module path
+        b"foo.bar.error: blah\n"
+    )
+    rptr = StatusReporter.load(status_db_file, tb_path=tmp_path)
     assert len(rptr.tracebacks) == 2
     # create third screenlog
-    with (tmp_path / "screenlog.3").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"KeyboardInterrupt\n")
-    rptr = StatusReporter.load(db_file, tb_path=tmp_path)
+    (tmp_path / "screenlog.3").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        # KeyboardInterrupt tracebacks are not included in the summary
+        b"KeyboardInterrupt\n"
+    )
+    rptr = StatusReporter.load(status_db_file, tb_path=tmp_path)
     assert len(rptr.tracebacks) == 2
     merged_log = rptr.summary()
     assert len(merged_log.splitlines()) == 14
@@ -453,10 +464,11 @@ def test_status_reporter_07(tmp_path):
 def test_status_reporter_08(tmp_path):
     """test StatusReporter.load() no reports with traceback"""
     # create screenlog with tb
-    with (tmp_path / "screenlog.1").open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b"  blah\n")
-        test_fp.write(b"IndexError: list index out of range\n")
+    (tmp_path / "screenlog.1").write_bytes(
+        b"Traceback (most recent call last):\n"
+        b"  blah\n"
+        b"IndexError: list index out of range\n"
+    )
     rptr = StatusReporter.load(tmp_path / "status.db", tb_path=tmp_path)
     rptr._sys_info = _fake_sys_info
     assert len(rptr.tracebacks) == 1
@@ -466,36 +478,37 @@ def test_status_reporter_08(tmp_path):
     assert "IndexError" in output
 
 
-def test_status_reporter_09(mocker, tmp_path):
+def test_status_reporter_09(mocker, tmp_path, status_db_file):
     """test StatusReporter.summary() limit with traceback"""
     mocker.patch("grizzly.common.status.getpid", side_effect=(1, 2))
-    db_file = tmp_path / "status.db"
     # create reports
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 100
     status.iteration = 1000
     status.log_size = 9999999999
     status.results.count("uid1", "[@ sig1]")
     status.results._count["uid1"] = 123
     status.report(force=True)
-    status = Status.start(db_file)
+    status = Status.start(status_db_file)
     status.ignored = 9
     status.iteration = 192938
     status.log_size = 0
     status.results.count("uid2", "[@ sig2]")
     status.results._count["uid2"] = 3
     status.report(force=True)
-    # create screenlogs with tracebacks
+    # create screenlogs with tracebacks (identical content, build it once)
+    frames = b"".join(
+        TB_FILE_LINE + f"    some_long_name_for_a_func_{j:0>4d}()\n".encode()
+        for j in range(TracebackReport.MAX_LINES)
+    )
+    payload = (
+        b"Traceback (most recent call last):\n"
+        + frames
+        + b"IndexError: list index out of range\n"
+    )
     for i in range(10):
-        with (tmp_path / f"screenlog.{i}").open("w") as test_fp:
-            test_fp.write("Traceback (most recent call last):\n")
-            for j in range(TracebackReport.MAX_LINES):
-                test_fp.write(
-                    '  File "some/long/path/name/foobar.py", line 5000, in <module>\n'
-                )
-                test_fp.write(f"    some_long_name_for_a_func_{j:0>4d}()\n")
-            test_fp.write("IndexError: list index out of range\n")
-    rptr = StatusReporter.load(db_file, tb_path=tmp_path)
+        (tmp_path / f"screenlog.{i}").write_bytes(payload)
+    rptr = StatusReporter.load(status_db_file, tb_path=tmp_path)
     rptr._sys_info = _fake_sys_info
     assert len(rptr.tracebacks) == 10
     merged_log = rptr.summary(
@@ -540,15 +553,16 @@ def test_traceback_report_02(tmp_path):
 def test_traceback_report_03(tmp_path):
     """test TracebackReport.from_file()"""
     test_log = tmp_path / "screenlog.0"
-    with test_log.open("w") as test_fp:
-        test_fp.write("start junk\npre1\npre2\npre3\npre4\npre5\n")
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 556, in <module>\n')
-        test_fp.write("    main(parse_args())\n")
-        test_fp.write('  File "foo.py", line 207, in bar\n')
-        test_fp.write("    a = b[10]\n")
-        test_fp.write("IndexError: list index out of range\n")
-        test_fp.write("end junk\n")
+    test_log.write_text(
+        "start junk\npre1\npre2\npre3\npre4\npre5\n"
+        "Traceback (most recent call last):\n"
+        '  File "foo.py", line 556, in <module>\n'
+        "    main(parse_args())\n"
+        '  File "foo.py", line 207, in bar\n'
+        "    a = b[10]\n"
+        "IndexError: list index out of range\n"
+        "end junk\n"
+    )
     tbr = TracebackReport.from_file(test_log, ignore_kbi=True)
     assert len(tbr.prev_lines) == 5
     assert len(tbr.lines) == 6
@@ -560,15 +574,16 @@ def test_traceback_report_03(tmp_path):
     assert "screenlog.0" in output
     assert "junk" not in output
 
-    with test_log.open("w") as test_fp:
-        test_fp.write("start junk\n")
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 556, in <module>\n')
-        test_fp.write("    main(parse_args())\n")
-        test_fp.write('  File "foo.py", line 207, in bar\n')
-        test_fp.write("    a = b[10]\n")
-        test_fp.write("foo.bar.error: blah\n")
-        test_fp.write("end junk\n")
+    test_log.write_text(
+        "start junk\n"
+        "Traceback (most recent call last):\n"
+        '  File "foo.py", line 556, in <module>\n'
+        "    main(parse_args())\n"
+        '  File "foo.py", line 207, in bar\n'
+        "    a = b[10]\n"
+        "foo.bar.error: blah\n"
+        "end junk\n"
+    )
     tbr = TracebackReport.from_file(test_log, max_preceding=0)
     assert len(tbr.lines) == 6
     assert not tbr.prev_lines
@@ -579,14 +594,15 @@ def test_traceback_report_03(tmp_path):
     assert "foo.bar.error" in output
     assert "junk" not in output
     # kbi
-    with test_log.open("w") as test_fp:
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 556, in <module>\n')
-        test_fp.write("    main(parse_args())\n")
-        test_fp.write('  File "foo.py", line 207, in bar\n')
-        test_fp.write("    a = b[10]\n")
-        test_fp.write("KeyboardInterrupt\n")
-        test_fp.write("end junk\n")
+    test_log.write_text(
+        "Traceback (most recent call last):\n"
+        '  File "foo.py", line 556, in <module>\n'
+        "    main(parse_args())\n"
+        '  File "foo.py", line 207, in bar\n'
+        "    a = b[10]\n"
+        "KeyboardInterrupt\n"
+        "end junk\n"
+    )
     tbr = TracebackReport.from_file(test_log)
     assert tbr.is_kbi
     output = str(tbr)
@@ -599,17 +615,20 @@ def test_traceback_report_03(tmp_path):
 def test_traceback_report_04(tmp_path):
     """test TracebackReport.from_file() exceed size limit"""
     test_log = tmp_path / "screenlog.0"
-    with test_log.open("w") as test_fp:
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 5, in <module>\n')
-        test_fp.write("    first()\n")
-        test_fp.write('  File "foo.py", line 5, in <module>\n')
-        test_fp.write("    second()\n")
-        for i in reversed(range(TracebackReport.MAX_LINES)):
-            test_fp.write('  File "foo.py", line 5, in <module>\n')
-            test_fp.write(f"    func_{i:0>2d}()\n")
-        test_fp.write("END_WITH_BLANK_LINE\n\n")
-        test_fp.write("end junk\n")
+    test_log.write_text(
+        (
+            "Traceback (most recent call last):\n"
+            '  File "foo.py", line 5, in <module>\n'
+            "    first()\n"
+            '  File "foo.py", line 5, in <module>\n'
+            "    second()\n"
+        )
+        + "".join(
+            f'  File "foo.py", line 5, in <module>\n    func_{i:0>2d}()\n'
+            for i in reversed(range(TracebackReport.MAX_LINES))
+        )
+        + "END_WITH_BLANK_LINE\n\nend junk\n"
+    )
     tbr = TracebackReport.from_file(test_log)
     assert not tbr.is_kbi
     output = str(tbr)
@@ -625,13 +644,17 @@ def test_traceback_report_04(tmp_path):
 def test_traceback_report_05(tmp_path):
     """test TracebackReport.from_file() cut off"""
     test_log = tmp_path / "screenlog.0"
-    with test_log.open("w") as test_fp:
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 5, in <module>\n')
-        test_fp.write("    first()\n")
-        for i in range(TracebackReport.MAX_LINES * 2):
-            test_fp.write('  File "foo.py", line 5, in <module>\n')
-            test_fp.write(f"    func_{i}()\n")
+    test_log.write_text(
+        (
+            "Traceback (most recent call last):\n"
+            '  File "foo.py", line 5, in <module>\n'
+            "    first()\n"
+        )
+        + "".join(
+            f'  File "foo.py", line 5, in <module>\n    func_{i}()\n'
+            for i in range(TracebackReport.MAX_LINES * 2)
+        )
+    )
     tbr = TracebackReport.from_file(test_log)
     assert not tbr.is_kbi
     output = str(tbr)
@@ -643,12 +666,13 @@ def test_traceback_report_05(tmp_path):
 def test_traceback_report_06(tmp_path):
     """test TracebackReport.from_file() single word error"""
     test_log = tmp_path / "screenlog.0"
-    with test_log.open("w") as test_fp:
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 5, in <module>\n')
-        test_fp.write("    first()\n")
-        test_fp.write("AssertionError\n")
-        test_fp.write("end junk\n")
+    test_log.write_text(
+        "Traceback (most recent call last):\n"
+        '  File "foo.py", line 5, in <module>\n'
+        "    first()\n"
+        "AssertionError\n"
+        "end junk\n"
+    )
     tbr = TracebackReport.from_file(test_log)
     assert not tbr.is_kbi
     output = str(tbr)
@@ -661,11 +685,12 @@ def test_traceback_report_06(tmp_path):
 def test_traceback_report_07(tmp_path):
     """test TracebackReport.from_file() with binary data"""
     test_log = tmp_path / "screenlog.0"
-    with test_log.open("wb") as test_fp:
-        test_fp.write(b"Traceback (most recent call last):\n")
-        test_fp.write(b'  File "foo.py", line 5, in <module>\n')
-        test_fp.write(b"    bin\xd8()\n")
-        test_fp.write(b"AssertionError\n")
+    test_log.write_bytes(
+        b"Traceback (most recent call last):\n"
+        b'  File "foo.py", line 5, in <module>\n'
+        b"    bin\xd8()\n"
+        b"AssertionError\n"
+    )
     tbr = TracebackReport.from_file(test_log)
     assert not tbr.is_kbi
     output = str(tbr)
@@ -676,12 +701,13 @@ def test_traceback_report_07(tmp_path):
 def test_traceback_report_08(tmp_path):
     """test TracebackReport.from_file() locate token across chunks"""
     test_log = tmp_path / "screenlog.0"
-    with test_log.open("w") as test_fp:
-        test_fp.write("A" * (TracebackReport.READ_LIMIT - 5))
-        test_fp.write("Traceback (most recent call last):\n")
-        test_fp.write('  File "foo.py", line 5, in <module>\n')
-        test_fp.write("    first()\n")
-        test_fp.write("AssertionError\n")
+    test_log.write_text(
+        "A" * (TracebackReport.READ_LIMIT - 5)
+        + "Traceback (most recent call last):\n"
+        + '  File "foo.py", line 5, in <module>\n'
+        + "    first()\n"
+        + "AssertionError\n"
+    )
     tbr = TracebackReport.from_file(test_log)
     assert not tbr.is_kbi
     output = str(tbr)
@@ -758,11 +784,12 @@ def test_main_03(mocker, tmp_path, report_type, report_mode):
         )
         == 0
     )
-    assert dump_file.is_file()
+    # read once, this also fails if the dump file was not created
+    dump = dump_file.read_bytes()
     if report_type == "active":
-        assert b"Runtime" not in dump_file.read_bytes()
+        assert b"Runtime" not in dump
     else:
-        assert b"Timestamp" not in dump_file.read_bytes()
+        assert b"Timestamp" not in dump
 
 
 @mark.parametrize(
@@ -799,8 +826,9 @@ def test_main_04(mocker, tmp_path, report_type):
         )
         == 0
     )
-    assert dump_file.is_file()
+    # read once, this also fails if the dump file was not created
+    dump = dump_file.read_bytes()
     if report_type == "active":
-        assert b"Runtime" not in dump_file.read_bytes()
+        assert b"Runtime" not in dump
     else:
-        assert b"Timestamp" not in dump_file.read_bytes()
+        assert b"Timestamp" not in dump
@@ -3,10 +3,12 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """Common unit test fixtures for `grizzly`.
 """
+from shutil import copyfile
 
 from pytest import fixture
 
 from .adapter import Adapter
+from .common.status import Status
 from .target import Target
 
 
@@ -45,3 +47,21 @@ def tmp_path_status_db_reduce(tmp_path, mocker):
     """Use a temporary status database file for testing."""
     mocker.patch("grizzly.common.status.STATUS_DB_REDUCE", tmp_path / "reduce-tmp.db")
     mocker.patch("grizzly.reduce.core.STATUS_DB_REDUCE", tmp_path / "fuzzing-tmp.db")
+
+
+@fixture(scope="module")
+def status_db_template(tmp_path_factory):
+    """Status database containing only the schema, created once per module."""
+    db_file = tmp_path_factory.mktemp("status_db") / "status.db"
+    # creating a Status object initializes the database without adding a report
+    Status(0, 0.0, db_file)
+    return db_file
+
+
+@fixture
+def status_db_file(status_db_template, tmp_path):
+    """Provide a copy of the status database template. Do not use where
+    the database being created is part of the test (e.g. first run)."""
+    db_file = tmp_path / "status.db"
+    copyfile(status_db_template, db_file)
+    return db_file
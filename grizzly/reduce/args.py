@@ -53,21 +53,22 @@ class ReduceCommonArgs(ReplayCommonArgs):
         )
 
     def sanity_check(self, args):
-        """Sanity check reducer args.
+        """Sanity check reducer args. Errors are collected and reported together
+        by `parse_args()`.
 
         Arguments:
             args (argparse.Namespace): Result from `parse_args()`.
 
-        Raises:
-            SystemExit: on error, `ArgumentParser.error()` is called, which will exit.
+        Returns:
+            None
         """
         super().sanity_check(args)
 
         if args.report_period is not None:
             if args.report_period <= 0:
-                self.parser.error("Invalid --report-period (value is in seconds)")
-            if args.report_period < 60:
-                self.parser.error("Very short --report-period (value is in seconds)")
+                self._errors.append("Invalid --report-period (value is in seconds)")
+            elif args.report_period < 60:
+                self._errors.append("Very short --report-period (value is in seconds)")
 
         if not args.no_analysis:
             # analysis is enabled, but repeat/min_crashes specified. doesn't make sense
@@ -93,7 +94,7 @@ class ReduceArgs(ReduceCommonArgs):
         super().sanity_check(args)
 
         if not args.input.exists():
-            self.parser.error(f"'{args.input}' does not exist")
+            self._errors.append(f"'{args.input}' does not exist")
 
 
 class ReduceFuzzManagerIDArgs(ReduceCommonArgs):
@@ -77,22 +77,22 @@ class ReplayCommonArgs(CommonArgs):
         super().sanity_check(args)
 
         if args.any_crash and args.sig is not None:
-            self.parser.error("signature is ignored when running with --any-crash")
+            self._errors.append("signature is ignored when running with --any-crash")
 
         if args.idle_threshold and args.idle_delay <= 0:
-            self.parser.error("--idle-delay value must be positive")
+            self._errors.append("--idle-delay value must be positive")
 
         if args.logs is None and (args.pernosco or args.rr):
-            self.parser.error("--logs must be set when using rr")
+            self._errors.append("--logs must be set when using rr")
 
         if args.min_crashes < 1:
-            self.parser.error("--min-crashes value must be positive")
+            self._errors.append("--min-crashes value must be positive")
 
         if args.repeat < 1:
-            self.parser.error("--repeat value must be positive")
+            self._errors.append("--repeat value must be positive")
 
         if args.sig and not args.sig.is_file():
-            self.parser.error(f"signature file not found: '{args.sig}'")
+            self._errors.append(f"signature file not found: '{args.sig}'")
 
 
 class ReplayArgs(ReplayCommonArgs):
@@ -104,7 +104,7 @@ class ReplayArgs(ReplayCommonArgs):
         super().sanity_check(args)
 
         if not args.input.exists():
-            self.parser.error(f"'{args.input}' does not exist")
+            self._errors.append(f"'{args.input}' does not exist")
 
 
 class ReplayFuzzManagerIDArgs(ReplayCommonArgs):
@@ -126,4 +126,4 @@ class ReplayFuzzManagerIDQualityArgs(ReplayFuzzManagerIDArgs):
         super().sanity_check(args)
 
         if args.quality is not None and args.quality < 0:
-            self.parser.error("'--quality' value cannot be negative")
+            self._errors.append("'--quality' value cannot be negative")
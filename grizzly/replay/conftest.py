@@ -8,18 +8,41 @@ from pathlib import Path
 
 from pytest import fixture
 
-from sapphire import Sapphire
+from sapphire import Sapphire, Served
+
+from ..common.storage import TestCase
+from ..target import Target
+
+
+@fixture
+def patch_runner_sleep(mocker):
+    """Skip delays in Runner."""
+    mocker.patch("grizzly.common.runner.sleep", autospec=True)
 
 
 @fixture
 def server(mocker):
     """Mock Sapphire server"""
     srv = mocker.Mock(spec_set=Sapphire, port=1337, timeout=10)
+    srv.serve_path.return_value = (Served.ALL, ["index.html"])
     srv_cls = mocker.patch("grizzly.replay.replay.Sapphire", autospec=True)
     srv_cls.return_value.__enter__.return_value = srv
     return srv
 
 
+@fixture
+def target(mocker):
+    """Mock Target"""
+    return mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
+
+
+@fixture(scope="module")
+def testcase():
+    """TestCase shared by all tests in a module, it must not be modified"""
+    with TestCase("index.html", "redirect.html", "test-adapter") as test:
+        yield test
+
+
 @fixture
 def tmp_path_grz_tmp(tmp_path, mocker):
     """Provide an alternate working directory for testing."""
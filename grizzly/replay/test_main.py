@@ -29,12 +29,12 @@ pytestmark = mark.usefixtures(
 )
 
 
+@mark.usefixtures("patch_runner_sleep")
 def test_main_01(mocker, server, tmp_path):
     """test ReplayManager.main()"""
     # This is a typical scenario - a test that reproduces results ~50% of the time.
     # Of the four attempts only the first and third will 'reproduce' the result
     # and the forth attempt should be skipped.
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
     server.serve_path.return_value = (Served.ALL, ["test.html"])
     # setup Target
     load_target = mocker.patch("grizzly.replay.replay.load_plugin", autospec=True)
@@ -107,9 +107,9 @@ def test_main_01(mocker, server, tmp_path):
         (Result.FOUND, Result.NONE),
     ],
 )
+@mark.usefixtures("patch_runner_sleep")
 def test_main_02(mocker, server, tmp_path, repro_results):
     """test ReplayManager.main() - no repro"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
     server.serve_path.return_value = (Served.ALL, ["test.html"])
     # setup Target
     target = mocker.Mock(
@@ -342,11 +342,11 @@ def test_main_05(mocker, server, tmp_path):
         (False, False, True, False),
     ],  # pylint: disable=invalid-name
 )
+@mark.usefixtures("patch_runner_sleep")
 def test_main_06(
     mocker, server, tmp_path, pernosco, rr, valgrind, no_harness
 ):  # pylint: disable=invalid-name
     """test ReplayManager.main() enable debuggers"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
     server.serve_path.return_value = (Served.ALL, ["test.html"])
     # setup Target
     target = mocker.NonCallableMock(spec_set=Target, binary="bin", launch_timeout=30)
@@ -390,9 +390,9 @@ def test_main_06(
     assert load_target.return_value.call_args[-1]["valgrind"] == valgrind
 
 
+@mark.usefixtures("patch_runner_sleep")
 def test_main_07(mocker, server, tmp_path):
     """test ReplayManager.main() - report to FuzzManager"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
     server.serve_path.return_value = (Served.ALL, ["test.html"])
     reporter = mocker.patch("grizzly.replay.replay.FuzzManagerReporter", autospec=True)
     # setup Target
@@ -15,68 +15,96 @@ from sapphire import Served
 
 from ..common.reporter import Report
 from ..common.storage import TestCase, TestCaseLoadFailure
-from ..target import AssetManager, Result, Target
+from ..target import AssetManager, Result
 from .replay import ReplayManager, ReplayResult
 
 pytestmark = mark.usefixtures("patch_collector", "tmp_path_grz_tmp")
 
 
+FAKE_STDERR = b"STDERR log\n"
+FAKE_STDOUT = b"STDOUT log\n"
+FAKE_ASAN_HEADER = (
+    b"==1==ERROR: AddressSanitizer: "
+    b"SEGV on unknown address 0x0 (pc 0x0 bp 0x0 sp 0x0 T0)\n"
+)
+FAKE_ASAN = (
+    FAKE_ASAN_HEADER
+    + b"    #0 0xbad000 in foo /file1.c:123:234\n"
+    + b"    #1 0x1337dd in bar /file2.c:1806:19\n"
+)
+
+
 def _fake_save_logs(result_logs):
     """write fake log data to disk"""
     log_path = Path(result_logs)
-    (log_path / "log_stderr.txt").write_text("STDERR log\n")
-    (log_path / "log_stdout.txt").write_text("STDOUT log\n")
-    with (log_path / "log_asan_blah.txt").open("w") as log_fp:
-        log_fp.write("==1==ERROR: AddressSanitizer: ")
-        log_fp.write("SEGV on unknown address 0x0 (pc 0x0 bp 0x0 sp 0x0 T0)\n")
-        log_fp.write("    #0 0xbad000 in foo /file1.c:123:234\n")
-        log_fp.write("    #1 0x1337dd in bar /file2.c:1806:19\n")
+    (log_path / "log_stderr.txt").write_bytes(FAKE_STDERR)
+    (log_path / "log_stdout.txt").write_bytes(FAKE_STDOUT)
+    (log_path / "log_asan_blah.txt").write_bytes(FAKE_ASAN)
 
 
-def test_replay_01(mocker, server):
-    """test ReplayManager.run() - no repro"""
-    server.serve_path.return_value = (Served.ALL, ["index.html"])
-    target = mocker.Mock(spec_set=Target, closed=True, launch_timeout=30)
-    target.check_result.return_value = Result.NONE
-    target.monitor.is_healthy.return_value = False
-    iter_cb = mocker.Mock()
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, use_harness=True, relaunch=1) as replay:
-            assert not replay.run([testcase], 10, on_iteration_cb=iter_cb)
-            assert replay.signature is None
-            assert replay.status.ignored == 0
-            assert replay.status.iteration == iter_cb.call_count == 1
-            assert replay.status.results.total == 0
-            assert target.monitor.is_healthy.call_count == 1
-            assert target.close.call_count == 2
-            assert target.close.mock_calls[0] == mocker.call()
-            assert target.close.mock_calls[1] == mocker.call(force_close=True)
-
-
-def test_replay_02(mocker, server):
-    """test ReplayManager.run() - no repro - with repeats"""
-    server.serve_path.return_value = (Served.ALL, ["index.html"])
-    target = mocker.Mock(
-        spec_set=Target, binary=Path("bin"), closed=False, launch_timeout=30
+def _fake_report(mocker, crash_hash, major, minor, short_sig):
+    """create a mock Report"""
+    report = mocker.Mock(
+        spec_set=Report, crash_hash=crash_hash, major=major, minor=minor
+    )
+    report.crash_info.createShortSignature.return_value = short_sig
+    return report
+
+
+def _fake_result(mocker, report_path, prefix, expected):
+    """create a mock ReplayResult with a Report in a new directory"""
+    report_path.mkdir()
+    result = mocker.Mock(
+        spec_set=ReplayResult,
+        count=1,
+        durations=[1],
+        expected=expected,
+        served=[] if expected else None,
     )
+    result.report = mocker.Mock(spec_set=Report, path=report_path, prefix=prefix)
+    return result
+
+
+def _fake_tests(mocker, count=1):
+    """create mock TestCases that use 'a.html' as the landing page"""
+    return [
+        mocker.MagicMock(spec_set=TestCase, landing_page="a.html") for _ in range(count)
+    ]
+
+
+@mark.parametrize(
+    "closed, relaunch, repeat",
+    [
+        # single iteration
+        (True, 1, 1),
+        # with repeats
+        (False, 20, 10),
+    ],
+)
+def test_replay_01(mocker, server, target, testcase, closed, relaunch, repeat):
+    """test ReplayManager.run() - no repro"""
+    target.closed = closed
     target.check_result.return_value = Result.NONE
     target.monitor.is_healthy.return_value = False
     iter_cb = mocker.Mock()
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, use_harness=True, relaunch=20) as replay:
-            assert not replay.run(
-                [testcase], 10, repeat=10, min_results=1, on_iteration_cb=iter_cb
-            )
-            assert replay.signature is None
-            assert replay.status.ignored == 0
-            assert replay.status.iteration == iter_cb.call_count == 10
-            assert replay.status.results.total == 0
-            assert target.handle_hang.call_count == 0
-            assert target.monitor.is_healthy.call_count == 1
-            assert target.close.call_count == 2
+    with ReplayManager(
+        [], server, target, use_harness=True, relaunch=relaunch
+    ) as replay:
+        assert not replay.run(
+            [testcase], 10, repeat=repeat, min_results=1, on_iteration_cb=iter_cb
+        )
+        assert replay.signature is None
+        assert replay.status.ignored == 0
+        assert replay.status.iteration == iter_cb.call_count == repeat
+        assert replay.status.results.total == 0
+        assert target.handle_hang.call_count == 0
+        assert target.monitor.is_healthy.call_count == 1
+        assert target.close.call_count == 2
+        assert target.close.mock_calls[0] == mocker.call()
+        assert target.close.mock_calls[1] == mocker.call(force_close=True)
 
 
-def test_replay_03(mocker, server):
+def test_replay_02(mocker, server, target, testcase):
     """test ReplayManager.run() - exit - skip shutdown in runner"""
     # this will make runner appear to have just relaunched the target
     # and skip the expected shutdown
@@ -85,18 +113,16 @@ def test_replay_03(mocker, server):
         new_callable=mocker.PropertyMock,
         return_value=0,
     )
-    server.serve_path.return_value = (Served.ALL, ["index.html"])
-    target = mocker.Mock(spec_set=Target, closed=False, launch_timeout=30)
+    target.closed = False
     target.check_result.return_value = Result.NONE
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, use_harness=True, relaunch=20) as replay:
-            assert not replay.run([testcase], 10, repeat=10, min_results=1)
-            assert replay.status.ignored == 0
-            assert replay.status.iteration == 10
-            assert replay.status.results.total == 0
-            assert target.handle_hang.call_count == 0
-            assert target.monitor.is_healthy.call_count == 0
-            assert target.close.call_count == 1
+    with ReplayManager([], server, target, use_harness=True, relaunch=20) as replay:
+        assert not replay.run([testcase], 10, repeat=10, min_results=1)
+        assert replay.status.ignored == 0
+        assert replay.status.iteration == 10
+        assert replay.status.results.total == 0
+        assert target.handle_hang.call_count == 0
+        assert target.monitor.is_healthy.call_count == 0
+        assert target.close.call_count == 1
 
 
 @mark.parametrize(
@@ -108,11 +134,10 @@ def test_replay_03(mocker, server):
         False,
     ],
 )
-def test_replay_04(mocker, server, good_sig):
+def test_replay_03(mocker, server, target, testcase, good_sig):
     """test ReplayManager.run() - successful repro"""
     served = ["index.html"]
     server.serve_path.return_value = (Served.ALL, served)
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.monitor.is_healthy.return_value = False
     if good_sig:
@@ -122,40 +147,37 @@ def test_replay_04(mocker, server, good_sig):
         def _save_logs(result_logs):
             """create uninteresting logs"""
             log_path = Path(result_logs)
-            (log_path / "log_stderr.txt").write_text("STDERR log\n")
-            (log_path / "log_stdout.txt").write_text("STDOUT log\n")
+            (log_path / "log_stderr.txt").write_bytes(FAKE_STDERR)
+            (log_path / "log_stdout.txt").write_bytes(FAKE_STDOUT)
 
         target.save_logs = _save_logs
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, relaunch=10) as replay:
+    with ReplayManager([], server, target, relaunch=10) as replay:
+        assert replay.signature is None
+        results = replay.run([testcase], 10)
+        if good_sig:
+            assert replay.signature is not None
+        else:
             assert replay.signature is None
-            results = replay.run([testcase], 10)
-            if good_sig:
-                assert replay.signature is not None
-            else:
-                assert replay.signature is None
-            assert replay.status.ignored == 0
-            assert replay.status.iteration == 1
-            assert replay.status.results.total == 1
-            assert target.handle_hang.call_count == 0
-            assert target.monitor.is_healthy.call_count == 1
-            assert target.close.call_count == 2
-        assert len(results) == 1
-        assert results[0].count == 1
-        assert results[0].expected
-        assert results[0].report
-        assert len(results[0].served) == 1
-        assert results[0].served[0] == served
-        assert len(results[0].durations) == 1
-        results[0].report.cleanup()
+        assert replay.status.ignored == 0
+        assert replay.status.iteration == 1
+        assert replay.status.results.total == 1
+        assert target.handle_hang.call_count == 0
+        assert target.monitor.is_healthy.call_count == 1
+        assert target.close.call_count == 2
+    assert len(results) == 1
+    assert results[0].count == 1
+    assert results[0].expected
+    assert results[0].report
+    assert len(results[0].served) == 1
+    assert results[0].served[0] == served
+    assert len(results[0].durations) == 1
+    results[0].report.cleanup()
 
 
-def test_replay_05(mocker, server):
+def test_replay_04(mocker, server, target):
     """test ReplayManager.run() - error - landing page not requested"""
-    target = mocker.Mock(
-        spec_set=Target, binary=Path("bin"), closed=True, launch_timeout=30
-    )
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    target.closed = True
+    tests = _fake_tests(mocker)
     # test target unresponsive
     target.check_result.return_value = Result.NONE
     server.serve_path.return_value = (Served.NONE, [])
@@ -183,15 +205,14 @@ def test_replay_05(mocker, server):
     assert not results[0].expected
 
 
-def test_replay_06(mocker, server):
+def test_replay_05(mocker, server, target):
     """test ReplayManager.run()
     delayed failure - following test landing page not requested"""
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     type(target).closed = mocker.PropertyMock(side_effect=(True, False, True))
     target.check_result.side_effect = (Result.NONE, Result.FOUND)
     target.monitor.is_healthy.return_value = False
     target.save_logs = _fake_save_logs
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     server.serve_path.side_effect = (
         (Served.ALL, ["a.html"]),
         (Served.REQUEST, ["x"]),
@@ -205,13 +226,13 @@ def test_replay_06(mocker, server):
         assert target.close.call_count == 2
 
 
-def test_replay_07(mocker, server):
+def test_replay_06(mocker, server, target):
     """test ReplayManager.run() - ignored (timeout)"""
     server.serve_path.return_value = (Served.TIMEOUT, ["a.html"])
-    target = mocker.Mock(spec_set=Target, closed=True, launch_timeout=30)
+    target.closed = True
     target.check_result.return_value = Result.IGNORED
     target.handle_hang.return_value = True
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, use_harness=False) as replay:
         assert not replay.run(tests, 10)
         assert replay.status.ignored == 1
@@ -220,86 +241,86 @@ def test_replay_07(mocker, server):
     assert target.handle_hang.call_count == 1
 
 
-def test_replay_08(mocker, server):
+@mark.parametrize(
+    "check_results, healthy, min_results, exit_early, closes, iters, found, ignored",
+    [
+        # early failure
+        (
+            (Result.FOUND, Result.IGNORED, Result.NONE),
+            (False, False, True, False),
+            3,
+            True,
+            4,
+            3,
+            1,
+            1,
+        ),
+        # early success
+        (
+            (Result.FOUND, Result.IGNORED, Result.FOUND),
+            (False, False, False),
+            2,
+            True,
+            4,
+            3,
+            2,
+            1,
+        ),
+        # ignore early failure (perform all repeats)
+        ((Result.NONE,) * 4, cycle([True]), 4, False, 5, 4, 0, 0),
+        # ignore early success (perform all repeats)
+        ((Result.FOUND,) * 4, cycle([False]), 1, False, 5, 4, 4, 0),
+    ],
+)
+@mark.usefixtures("patch_runner_sleep")
+def test_replay_07(
+    mocker,
+    server,
+    target,
+    check_results,
+    healthy,
+    min_results,
+    exit_early,
+    closes,
+    iters,
+    found,
+    ignored,
+):
     """test ReplayManager.run() - early exit"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
     server.serve_path.return_value = (Served.ALL, ["a.html"])
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.save_logs = _fake_save_logs
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
-    # early failure
-    target.check_result.side_effect = (
-        Result.FOUND,
-        Result.IGNORED,
-        Result.NONE,
-    )
-    target.monitor.is_healthy.side_effect = (False, False, True, False)
-    with ReplayManager([], server, target, use_harness=False) as replay:
-        assert not replay.run(tests, 10, repeat=4, min_results=3)
-        assert target.close.call_count == 4
-        assert replay.status.iteration == 3
-        assert replay.status.results.total == 1
-        assert replay.status.ignored == 1
-    # early success
-    target.reset_mock()
-    target.check_result.side_effect = (
-        Result.FOUND,
-        Result.IGNORED,
-        Result.FOUND,
-    )
-    target.monitor.is_healthy.side_effect = (False, False, False)
-    with ReplayManager([], server, target, use_harness=False) as replay:
-        results = replay.run(tests, 10, repeat=4, min_results=2)
-        assert target.close.call_count == 4
-        assert replay.status.iteration == 3
-        assert replay.status.results.total == 2
-        assert replay.status.ignored == 1
-    assert len(results) == 1
-    assert sum(x.count for x in results) == 2
-    target.reset_mock()
-    # ignore early failure (perform all repeats)
-    target.check_result.return_value = Result.NONE
-    target.check_result.side_effect = None
-    target.monitor.is_healthy.side_effect = None
-    target.monitor.is_healthy.return_value = True
-    with ReplayManager([], server, target, use_harness=False) as replay:
-        assert not replay.run(tests, 10, repeat=4, min_results=4, exit_early=False)
-        assert target.close.call_count == 5
-        assert replay.status.iteration == 4
-        assert replay.status.results.total == 0
-        assert replay.status.ignored == 0
-    target.reset_mock()
-    # ignore early success (perform all repeats)
-    target.check_result.return_value = Result.FOUND
-    target.monitor.is_healthy.return_value = False
+    target.check_result.side_effect = check_results
+    target.monitor.is_healthy.side_effect = healthy
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, use_harness=False) as replay:
-        results = replay.run(tests, 10, repeat=4, min_results=1, exit_early=False)
-        assert target.close.call_count == 5
-        assert replay.status.iteration == 4
-        assert replay.status.results.total == 4
-        assert replay.status.ignored == 0
-    assert len(results) == 1
-    assert sum(x.count for x in results) == 4
+        results = replay.run(
+            tests, 10, repeat=4, min_results=min_results, exit_early=exit_early
+        )
+        assert target.close.call_count == closes
+        assert replay.status.iteration == iters
+        assert replay.status.results.total == found
+        assert replay.status.ignored == ignored
+    if found >= min_results:
+        assert len(results) == 1
+        assert results[0].count == found
+    else:
+        assert not results
 
 
-def test_replay_09(mocker, server):
+@mark.usefixtures("patch_runner_sleep")
+def test_replay_08(mocker, server, target):
     """test ReplayManager.run() - test signatures - fail to meet minimum"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
-    report_1 = mocker.Mock(spec_set=Report, crash_hash="h1", major="0123", minor="0123")
-    report_1.crash_info.createShortSignature.return_value = "[@ test1]"
-    report_2 = mocker.Mock(spec_set=Report, crash_hash="h2", major="0123", minor="abcd")
-    report_2.crash_info.createShortSignature.return_value = "[@ test2]"
-    report_3 = mocker.Mock(spec_set=Report, crash_hash="h2", major="0123", minor="abcd")
-    report_3.crash_info.createShortSignature.return_value = "[@ test2]"
+    report_1 = _fake_report(mocker, "h1", "0123", "0123", "[@ test1]")
+    report_2 = _fake_report(mocker, "h2", "0123", "abcd", "[@ test2]")
+    report_3 = _fake_report(mocker, "h2", "0123", "abcd", "[@ test2]")
     fake_report = mocker.patch("grizzly.replay.replay.Report", autospec=True)
     fake_report.side_effect = (report_1, report_2, report_3)
     fake_report.calc_hash.return_value = "bucketHASH"
     server.serve_path.return_value = (Served.ALL, ["a.html"])
     signature = mocker.Mock()
     signature.matches.side_effect = (True, False, False)
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     target.check_result.return_value = Result.FOUND
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager(
         [], server, target, signature=signature, use_harness=False
     ) as replay:
@@ -319,22 +340,19 @@ def test_replay_09(mocker, server):
     assert signature.matches.call_count == 3
 
 
-def test_replay_10(mocker, server):
+def test_replay_09(mocker, server, target):
     """test ReplayManager.run() - test signatures - multiple matches"""
-    report_0 = mocker.Mock(spec_set=Report, crash_hash="h1", major="0123", minor="0123")
-    report_0.crash_info.createShortSignature.return_value = "[@ test1]"
-    report_1 = mocker.Mock(spec_set=Report, crash_hash="h2", major="0123", minor="abcd")
-    report_1.crash_info.createShortSignature.return_value = "[@ test2]"
+    report_0 = _fake_report(mocker, "h1", "0123", "0123", "[@ test1]")
+    report_1 = _fake_report(mocker, "h2", "0123", "abcd", "[@ test2]")
     fake_report = mocker.patch("grizzly.replay.replay.Report", autospec=True)
     fake_report.side_effect = (report_0, report_1)
     fake_report.calc_hash.return_value = "bucketHASH"
     server.serve_path.return_value = (Served.ALL, ["a.html"])
     sig = mocker.Mock(spec_set=CrashSignature)
     sig.matches.side_effect = (True, True)
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.monitor.is_healthy.return_value = False
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, signature=sig, use_harness=False) as replay:
         results = replay.run(tests, 10, repeat=2, min_results=2)
         assert target.close.call_count == 3
@@ -351,19 +369,16 @@ def test_replay_10(mocker, server):
     assert sig.matches.call_count == 2
 
 
-def test_replay_11(mocker, server):
+def test_replay_10(mocker, server, target):
     """test ReplayManager.run() - any crash - success"""
-    report_1 = mocker.Mock(spec_set=Report, crash_hash="h1", major="0123", minor="0123")
-    report_1.crash_info.createShortSignature.return_value = "[@ test1]"
-    report_2 = mocker.Mock(spec_set=Report, crash_hash="h2", major="0123", minor="abcd")
-    report_2.crash_info.createShortSignature.return_value = "[@ test2]"
+    report_1 = _fake_report(mocker, "h1", "0123", "0123", "[@ test1]")
+    report_2 = _fake_report(mocker, "h2", "0123", "abcd", "[@ test2]")
     fake_report = mocker.patch("grizzly.replay.replay.Report", autospec=True)
     fake_report.side_effect = (report_1, report_2)
     server.serve_path.return_value = (Served.ALL, ["a.html"])
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.monitor.is_healthy.return_value = False
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, any_crash=True, use_harness=False) as replay:
         results = replay.run(tests, 10, repeat=2, min_results=2)
         assert target.close.call_count == 3
@@ -379,16 +394,13 @@ def test_replay_11(mocker, server):
     assert report_2.cleanup.call_count == 0
 
 
-def test_replay_12(mocker, server):
+def test_replay_11(mocker, server, target):
     """test ReplayManager.run() - any crash - fail to meet minimum"""
-    report_1 = mocker.Mock(spec_set=Report, crash_hash="h1", major="0123", minor="0123")
-    report_1.crash_info.createShortSignature.return_value = "[@ test1]"
-    report_2 = mocker.Mock(spec_set=Report, crash_hash="h2", major="0123", minor="abcd")
-    report_2.crash_info.createShortSignature.return_value = "[@ test2]"
+    report_1 = _fake_report(mocker, "h1", "0123", "0123", "[@ test1]")
+    report_2 = _fake_report(mocker, "h2", "0123", "abcd", "[@ test2]")
     fake_report = mocker.patch("grizzly.replay.replay.Report", autospec=True)
     fake_report.side_effect = (report_1, report_2)
     server.serve_path.return_value = (Served.ALL, ["a.html"])
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     target.check_result.side_effect = (
         Result.NONE,
         Result.FOUND,
@@ -396,7 +408,7 @@ def test_replay_12(mocker, server):
         Result.NONE,
     )
     target.monitor.is_healthy.return_value = False
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, any_crash=True) as replay:
         assert not replay.run(tests, 10, repeat=4, min_results=3)
         assert target.close.call_count == 5
@@ -409,14 +421,13 @@ def test_replay_12(mocker, server):
     assert report_2.cleanup.call_count == 1
 
 
-def test_replay_13(mocker, server):
+def test_replay_12(mocker, server, target):
     """test ReplayManager.run() - any crash - startup failure"""
     server.serve_path.return_value = (Served.NONE, [])
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.save_logs = _fake_save_logs
     target.monitor.is_healthy.return_value = False
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, any_crash=True, use_harness=False) as replay:
         results = replay.run(tests, 10, repeat=1, min_results=1)
         assert results
@@ -427,28 +438,24 @@ def test_replay_13(mocker, server):
         assert replay.status.ignored == 1
 
 
-def test_replay_14(mocker, server):
+def test_replay_13(mocker, server, target):
     """test ReplayManager.run() - no signature - use first crash"""
     auto_sig = mocker.Mock(spec_set=CrashSignature)
     auto_sig.matches.side_effect = (True, False, True)
     # original
-    report_1 = mocker.Mock(spec_set=Report, crash_hash="h1", major="012", minor="999")
-    report_1.crash_info.createShortSignature.return_value = "[@ test1]"
+    report_1 = _fake_report(mocker, "h1", "012", "999", "[@ test1]")
     report_1.crash_signature = auto_sig
     # non matching report
-    report_2 = mocker.Mock(spec_set=Report, crash_hash="h2", major="abc", minor="987")
-    report_2.crash_info.createShortSignature.return_value = "[@ test2]"
+    report_2 = _fake_report(mocker, "h2", "abc", "987", "[@ test2]")
     # matching report
-    report_3 = mocker.Mock(spec_set=Report, crash_hash="h1", major="012", minor="999")
-    report_3.crash_info.createShortSignature.return_value = "[@ test1]"
+    report_3 = _fake_report(mocker, "h1", "012", "999", "[@ test1]")
     fake_report = mocker.patch("grizzly.replay.replay.Report", autospec=True)
     fake_report.side_effect = (report_1, report_2, report_3)
     fake_report.calc_hash.return_value = "bucket_hash"
     server.serve_path.return_value = (Served.ALL, ["a.html"])
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.monitor.is_healthy.return_value = False
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager([], server, target, use_harness=False) as replay:
         results = replay.run(tests, 10, repeat=3, min_results=2)
         assert target.close.call_count == 4
@@ -465,16 +472,14 @@ def test_replay_14(mocker, server):
     assert report_3.cleanup.call_count == 1
 
 
-def test_replay_15(mocker, server):
+def test_replay_14(mocker, server, target):
     """test ReplayManager.run() - unexpected exception"""
-    report_0 = mocker.Mock(spec_set=Report, crash_hash="h1", major="0123", minor="0123")
-    report_0.crash_info.createShortSignature.return_value = "[@ test1]"
+    report_0 = _fake_report(mocker, "h1", "0123", "0123", "[@ test1]")
     fake_report = mocker.patch("grizzly.replay.replay.Report", autospec=True)
     fake_report.side_effect = (report_0,)
     server.serve_path.side_effect = ((Served.ALL, ["a.html"]), KeyboardInterrupt)
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     target.check_result.return_value = Result.FOUND
-    tests = [mocker.MagicMock(spec_set=TestCase, landing_page="a.html")]
+    tests = _fake_tests(mocker)
     with ReplayManager(
         [], server, target, any_crash=True, use_harness=True, relaunch=2
     ) as replay:
@@ -490,15 +495,13 @@ def test_replay_15(mocker, server):
     assert report_0.cleanup.call_count == 1
 
 
-def test_replay_16(mocker, server):
+@mark.usefixtures("patch_runner_sleep")
+def test_replay_15(mocker, server, target):
     """test ReplayManager.run() - multiple TestCases - no repro"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
     server.serve_path.return_value = (Served.ALL, ["a.html"])
-    target = mocker.Mock(spec_set=Target, closed=True, launch_timeout=30)
+    target.closed = True
     target.check_result.return_value = Result.NONE
-    tests = [
-        mocker.MagicMock(spec_set=TestCase, landing_page="a.html") for _ in range(3)
-    ]
+    tests = _fake_tests(mocker, count=3)
     with ReplayManager([], server, target, use_harness=True) as replay:
         assert not replay.run(tests, 10)
         assert replay.status.ignored == 0
@@ -507,17 +510,14 @@ def test_replay_16(mocker, server):
     assert target.close.call_count == 2
 
 
-def test_replay_17(mocker, server):
+def test_replay_16(mocker, server, target):
     """test ReplayManager.run() - multiple TestCases - no repro - with repeats"""
     server.serve_path.return_value = (Served.ALL, ["a.html"])
-    target = mocker.Mock(spec_set=Target, launch_timeout=30)
     # test relaunch < repeat
     type(target).closed = mocker.PropertyMock(side_effect=cycle([True, False]))
     target.check_result.return_value = Result.NONE
     target.monitor.is_healthy.return_value = False
-    tests = [
-        mocker.MagicMock(spec_set=TestCase, landing_page="a.html") for _ in range(3)
-    ]
+    tests = _fake_tests(mocker, count=3)
     with ReplayManager([], server, target, use_harness=True, relaunch=2) as replay:
         assert not replay.run(tests, 10, repeat=10, post_launch_delay=-1)
         assert server.serve_path.call_count == 30
@@ -529,14 +529,13 @@ def test_replay_17(mocker, server):
     assert target.monitor.is_healthy.call_count == 5
 
 
-def test_replay_18(mocker, server):
+def test_replay_17(mocker, server, target):
     """test ReplayManager.run() - multiple TestCases - successful repro"""
     server.serve_path.side_effect = (
         (Served.ALL, ["0.html"]),
         (Served.ALL, ["1.html"]),
         (Served.ALL, ["2.html"]),
     )
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.check_result.side_effect = (
         Result.NONE,
         Result.NONE,
@@ -561,50 +560,30 @@ def test_replay_18(mocker, server):
     assert len(results[0].durations) == len(tests)
 
 
-def test_replay_19(mocker, server):
+@mark.usefixtures("patch_runner_sleep")
+def test_replay_18(server, target, testcase):
     """test ReplayManager.run() - multiple calls"""
-    mocker.patch("grizzly.common.runner.sleep", autospec=True)
-    server.serve_path.return_value = (Served.ALL, ["index.html"])
-    target = mocker.Mock(spec_set=Target, closed=True, launch_timeout=30)
+    target.closed = True
     target.check_result.return_value = Result.NONE
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, use_harness=True) as replay:
-            assert not replay.run([testcase], 30, post_launch_delay=-1)
-            assert replay.status.iteration == 1
-            assert not replay.run([testcase], 30, post_launch_delay=-1)
-            assert replay.status.iteration == 1
-            assert not replay.run([testcase], 30, post_launch_delay=-1)
-            assert replay.status.iteration == 1
+    with ReplayManager([], server, target, use_harness=True) as replay:
+        assert not replay.run([testcase], 30, post_launch_delay=-1)
+        assert replay.status.iteration == 1
+        assert not replay.run([testcase], 30, post_launch_delay=-1)
+        assert replay.status.iteration == 1
+        assert not replay.run([testcase], 30, post_launch_delay=-1)
+        assert replay.status.iteration == 1
     assert server.serve_path.call_count == 3
 
 
-def test_replay_20(mocker, tmp_path):
+def test_replay_19(mocker, tmp_path):
     """test ReplayManager.report_to_filesystem()"""
     # no reports
     ReplayManager.report_to_filesystem(tmp_path, [])
     assert not any(tmp_path.iterdir())
     # with reports and tests
-    (tmp_path / "report_expected").mkdir()
-    result0 = mocker.Mock(
-        spec_set=ReplayResult, count=1, durations=[1], expected=True, served=[]
-    )
-    result0.report = mocker.Mock(
-        spec_set=Report, path=tmp_path / "report_expected", prefix="expected"
-    )
-    (tmp_path / "report_other1").mkdir()
-    result1 = mocker.Mock(
-        spec_set=ReplayResult, count=1, durations=[1], expected=False, served=None
-    )
-    result1.report = mocker.Mock(
-        spec_set=Report, path=tmp_path / "report_other1", prefix="other1"
-    )
-    (tmp_path / "report_other2").mkdir()
-    result2 = mocker.Mock(
-        spec_set=ReplayResult, count=1, durations=[1], expected=False, served=None
-    )
-    result2.report = mocker.Mock(
-        spec_set=Report, path=tmp_path / "report_other2", prefix="other2"
-    )
+    result0 = _fake_result(mocker, tmp_path / "report_expected", "expected", True)
+    result1 = _fake_result(mocker, tmp_path / "report_other1", "other1", False)
+    result2 = _fake_result(mocker, tmp_path / "report_other2", "other2", False)
     test = mocker.Mock(spec_set=TestCase, timestamp=1.0)
     path = tmp_path / "dest"
     ReplayManager.report_to_filesystem(path, [result0, result1, result2], tests=[test])
@@ -628,7 +607,7 @@ def test_replay_20(mocker, tmp_path):
     assert (path / "reports" / "expected_logs").is_dir()
 
 
-def test_replay_21(mocker, tmp_path):
+def test_replay_20(mocker, tmp_path):
     """test ReplayManager.load_testcases()"""
     fake_load = mocker.patch("grizzly.replay.replay.TestCase.load")
     test0 = mocker.Mock(spec_set=TestCase, env_vars={"env": "var"})
@@ -690,8 +669,18 @@ def test_replay_21(mocker, tmp_path):
         (False, False, True, False, 1, 0),
     ],
 )
-def test_replay_22(
-    mocker, server, expect_hang, is_hang, use_sig, match_sig, ignored, results
+def test_replay_21(
+    mocker,
+    monkeypatch,
+    server,
+    target,
+    testcase,
+    expect_hang,
+    is_hang,
+    use_sig,
+    match_sig,
+    ignored,
+    results,
 ):
     """test ReplayManager.run() - detect hangs"""
     served = ["index.html"]
@@ -705,38 +694,34 @@ def test_replay_22(
         signature.rawSignature = "fakesig"
     else:
         signature = None
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.handle_hang.return_value = False
     target.save_logs = _fake_save_logs
     target.monitor.is_healthy.return_value = False
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        testcase.hang = is_hang
-        with ReplayManager(
-            [], server, target, signature=signature, relaunch=10
-        ) as replay:
-            found = replay.run(
-                [testcase], 10, expect_hang=expect_hang, post_launch_delay=-1
-            )
-            assert replay.status.iteration == 1
-            assert replay.status.ignored == ignored
-            assert replay.status.results.total == results
-            assert target.handle_hang.call_count == (1 if is_hang else 0)
-            assert target.monitor.is_healthy.call_count == (0 if is_hang else 1)
-            assert target.close.call_count == (1 if is_hang else 2)
-        assert len(found) == 1
-        assert found[0].count == 1
-        assert found[0].expected == results
-        assert found[0].report
-        assert found[0].report.is_hang == is_hang
-        assert len(found[0].served) == 1
-        assert found[0].served[0] == served
-        assert len(found[0].durations) == 1
-        assert testcase.hang == is_hang
-        found[0].report.cleanup()
-
-
-def test_replay_23(mocker):
+    monkeypatch.setattr(testcase, "hang", is_hang)
+    with ReplayManager([], server, target, signature=signature, relaunch=10) as replay:
+        found = replay.run(
+            [testcase], 10, expect_hang=expect_hang, post_launch_delay=-1
+        )
+        assert replay.status.iteration == 1
+        assert replay.status.ignored == ignored
+        assert replay.status.results.total == results
+        assert target.handle_hang.call_count == (1 if is_hang else 0)
+        assert target.monitor.is_healthy.call_count == (0 if is_hang else 1)
+        assert target.close.call_count == (1 if is_hang else 2)
+    assert len(found) == 1
+    assert found[0].count == 1
+    assert found[0].expected == results
+    assert found[0].report
+    assert found[0].report.is_hang == is_hang
+    assert len(found[0].served) == 1
+    assert found[0].served[0] == served
+    assert len(found[0].durations) == 1
+    assert testcase.hang == is_hang
+    found[0].report.cleanup()
+
+
+def test_replay_22(mocker):
     """test ReplayManager.report_to_fuzzmanager()"""
     reporter = mocker.patch("grizzly.replay.replay.FuzzManagerReporter")
     # no reports or tests
@@ -765,7 +750,7 @@ def test_replay_23(mocker):
     assert reporter.return_value.submit.call_count == 2
 
 
-def test_replay_24(mocker, server, tmp_path):
+def test_replay_23(mocker, server, target, testcase, tmp_path):
     """test ReplayManager.run() - signature - matching stacks"""
     sig_file = tmp_path / "sig.json"
     sig_file.write_text(
@@ -781,8 +766,6 @@ def test_replay_24(mocker, server, tmp_path):
     )
     sig = CrashSignature.fromFile(str(sig_file))
 
-    server.serve_path.return_value = (Served.ALL, ["index.html"])
-    target = mocker.MagicMock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.monitor.is_healthy.return_value = False
 
@@ -793,28 +776,27 @@ def test_replay_24(mocker, server, tmp_path):
         nonlocal call_count
         call_count += 1
         log_path = Path(result_logs)
-        (log_path / "log_stderr.txt").write_text("STDERR log\n")
-        (log_path / "log_stdout.txt").write_text("STDOUT log\n")
-        with (log_path / "log_asan_blah.txt").open("w") as log_fp:
-            log_fp.write("==1==ERROR: AddressSanitizer: ")
-            log_fp.write("SEGV on unknown address 0x0 (pc 0x0 bp 0x0 sp 0x0 T0)\n")
-            log_fp.write(f"    #0 0xbad000 in call_a{call_count:02d} file.c:23:34\n")
-            log_fp.write(f"    #1 0xbad001 in call_b{call_count:02d} file.c:12:45\n")
+        (log_path / "log_stderr.txt").write_bytes(FAKE_STDERR)
+        (log_path / "log_stdout.txt").write_bytes(FAKE_STDOUT)
+        (log_path / "log_asan_blah.txt").write_bytes(
+            FAKE_ASAN_HEADER
+            + f"    #0 0xbad000 in call_a{call_count:02d} file.c:23:34\n".encode()
+            + f"    #1 0xbad001 in call_b{call_count:02d} file.c:12:45\n".encode()
+        )
 
     target.save_logs.side_effect = _save_logs_variation
 
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, relaunch=10, signature=sig) as replay:
-            results = replay.run([testcase], 10, min_results=2, repeat=2)
-            assert replay.signature is not None
-            assert replay.status.ignored == 0
-            assert replay.status.iteration == 2
-            assert replay.status.results.total == 2
-        assert len(results) == 1
-        assert results[0].count == 2
-        assert results[0].expected
-        assert results[0].report
-        results[0].report.cleanup()
+    with ReplayManager([], server, target, relaunch=10, signature=sig) as replay:
+        results = replay.run([testcase], 10, min_results=2, repeat=2)
+        assert replay.signature is not None
+        assert replay.status.ignored == 0
+        assert replay.status.iteration == 2
+        assert replay.status.results.total == 2
+    assert len(results) == 1
+    assert results[0].count == 2
+    assert results[0].expected
+    assert results[0].report
+    results[0].report.cleanup()
 
 
 @mark.parametrize(
@@ -838,15 +820,15 @@ def test_replay_24(mocker, server, tmp_path):
         (["STDERR log\n", "STDERR log\n"], 1, 1, [True, False]),
     ],
 )
-def test_replay_25(mocker, server, stderr_log, ignored, total, include_stack):
+def test_replay_24(
+    mocker, server, target, testcase, stderr_log, ignored, total, include_stack
+):
     """test ReplayManager.run() - no signature - match first result"""
     # NOTE: this is similar to "no signature - use first crash" test
     # but this is more of an integration test
     iters = len(stderr_log)
     assert iters == ignored + total, "test is broken"
     assert iters == len(include_stack), "test is broken"
-    server.serve_path.return_value = (Served.ALL, ["index.html"])
-    target = mocker.Mock(spec_set=Target, binary=Path("bin"), launch_timeout=30)
     target.check_result.return_value = Result.FOUND
     target.monitor.is_healthy.return_value = False
 
@@ -856,27 +838,26 @@ def test_replay_25(mocker, server, stderr_log, ignored, total, include_stack):
         nonlocal include_stack
         log_path = Path(result_logs)
         (log_path / "log_stderr.txt").write_text(stderr_log.pop(0))
-        (log_path / "log_stdout.txt").write_text("STDOUT log\n")
+        (log_path / "log_stdout.txt").write_bytes(FAKE_STDOUT)
         if include_stack.pop(0):
-            with (log_path / "log_asan_blah.txt").open("w") as log_fp:
-                log_fp.write("==1==ERROR: AddressSanitizer: ")
-                log_fp.write("SEGV on unknown address 0x0 (pc 0x0 bp 0x0 sp 0x0 T0)\n")
-                log_fp.write("    #0 0xbad000 in call_a file.c:23:34\n")
-                log_fp.write("    #1 0xbad001 in call_b file.c:12:45\n")
+            (log_path / "log_asan_blah.txt").write_bytes(
+                FAKE_ASAN_HEADER
+                + b"    #0 0xbad000 in call_a file.c:23:34\n"
+                + b"    #1 0xbad001 in call_b file.c:12:45\n"
+            )
 
     target.save_logs.side_effect = _save_logs_variation
 
     has_sig = include_stack[0]
-    with TestCase("index.html", "redirect.html", "test-adapter") as testcase:
-        with ReplayManager([], server, target, relaunch=10) as replay:
-            results = replay.run([testcase], 10, min_results=2, repeat=iters)
-            if has_sig:
-                assert replay.signature is not None
-            else:
-                assert replay.signature is None
-            assert replay.status.ignored == ignored
-            assert replay.status.iteration == iters
-            assert replay.status.results.total == total
-        for result in results:
-            result.report.cleanup()
-        assert results
+    with ReplayManager([], server, target, relaunch=10) as replay:
+        results = replay.run([testcase], 10, min_results=2, repeat=iters)
+        if has_sig:
+            assert replay.signature is not None
+        else:
+            assert replay.signature is None
+        assert replay.status.ignored == ignored
+        assert replay.status.iteration == iters
+        assert replay.status.results.total == total
+    for result in results:
+        result.report.cleanup()
+    assert results
@@ -15,6 +15,13 @@ from .args import CommonArgs, GrizzlyArgs
         ([], {}),
         # test no-harness and relaunch
         (["--no-harness"], {"relaunch": 1}),
+        # test duplicate ignore values are removed
+        (
+            ["--ignore", "memory", "timeout", "memory"],
+            {"ignore": ["memory", "timeout"]},
+        ),
+        # test ignore can be disabled
+        (["--ignore"], {"ignore": []}),
     ],
 )
 def test_common_args_01(mocker, tmp_path, extra_args, results):
@@ -113,6 +120,24 @@ def test_common_args_02(capsys, mocker, args, msg, idx):
             "error: --tool cannot contain whitespace",
             ["targ1"],
         ),
+        # test invalid ignore value
+        (
+            ["--ignore", "timeout", "foo", "bar"],
+            "error: Unrecognized ignore values: bar, foo",
+            ["targ1"],
+        ),
+        # test ignore values are case sensitive
+        (
+            ["--ignore", "Memory"],
+            "error: Unrecognized ignore values: Memory",
+            ["targ1"],
+        ),
+        # test invalid tool usage
+        (
+            ["--platform", "targ1", "--fuzzmanager", "--tool", "x\t"],
+            "error: --tool cannot contain whitespace",
+            ["targ1"],
+        ),
         # test invalid launch-attempts value
         (
             ["--launch-attempts", "0"],
@@ -160,6 +185,80 @@ def test_common_args_05(mocker):
     assert CommonArgs.is_headless()
 
 
+def test_common_args_06(capsys, mocker, tmp_path):
+    """test CommonArgs() - asset help is generated on demand"""
+    mocker.patch("grizzly.args.scan_plugins", autospec=True, return_value=["targ1"])
+    scan_assets = mocker.patch(
+        "grizzly.args.scan_target_assets",
+        autospec=True,
+        return_value={"targ1": ["b", "a"], "targ2": []},
+    )
+    args = CommonArgs()
+    assert scan_assets.call_count == 0
+    with raises(SystemExit):
+        args.parse_args(argv=["-h"])
+    assert scan_assets.call_count == 1
+    assert "targ1: a, b." in capsys.readouterr()[0]
+    # scan results are reused by sanity_check()
+    fake_bin = tmp_path / "fake.bin"
+    fake_bin.touch()
+    args.parse_args(argv=[str(fake_bin), "--platform", "targ1", "--asset", "a", "."])
+    assert scan_assets.call_count == 1
+
+
+@mark.parametrize(
+    "ext, valid",
+    [
+        # directory containing unpacked extension
+        ("ext", True),
+        # xpi file
+        ("ext.xpi", True),
+        # unsupported file
+        ("ext.txt", False),
+    ],
+)
+def test_common_args_07(capsys, mocker, tmp_path, ext, valid):
+    """test CommonArgs.parse_args() - extension asset validation"""
+    mocker.patch("grizzly.args.scan_plugins", autospec=True, return_value=["targ1"])
+    mocker.patch(
+        "grizzly.args.scan_target_assets",
+        autospec=True,
+        return_value={"targ1": ["extension"]},
+    )
+    fake_bin = tmp_path / "fake.bin"
+    fake_bin.touch()
+    ext_path = tmp_path / ext
+    if ext_path.suffix:
+        ext_path.touch()
+    else:
+        ext_path.mkdir()
+    cmd = [str(fake_bin), "--platform", "targ1", "--asset", "extension", str(ext_path)]
+    if valid:
+        args = CommonArgs().parse_args(argv=cmd)
+        assert args.asset == [["extension", str(ext_path)]]
+    else:
+        with raises(SystemExit):
+            CommonArgs().parse_args(argv=cmd)
+        assert (
+            f"error: Extension {str(ext_path)!r} must be a folder or .xpi"
+            in capsys.readouterr()[-1]
+        )
+
+
+def test_common_args_08(capsys, mocker, tmp_path):
+    """test CommonArgs.parse_args() - report all errors"""
+    mocker.patch("grizzly.args.scan_plugins", autospec=True, return_value=["targ1"])
+    fake_bin = tmp_path / "fake.bin"
+    fake_bin.touch()
+    with raises(SystemExit):
+        CommonArgs().parse_args(
+            argv=[str(fake_bin), "--log-limit", "-1", "--memory", "-1"]
+        )
+    stderr = capsys.readouterr()[-1]
+    assert "error: --log-limit must be >= 0" in stderr
+    assert "--memory must be >= 0" in stderr
+
+
 @mark.parametrize(
     "extra_args, results",
     [